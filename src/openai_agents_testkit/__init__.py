@@ -7,7 +7,7 @@ Basic Usage:
     >>> from agents import Agent, Runner, RunConfig
     >>> from openai_agents_testkit import FakeModelProvider
     >>>
-    >>> provider = FakeModelProvider(delay=0.1)
+    >>> provider = FakeModelProvider()
     >>> agent = Agent(name="Test", model="gpt-4", instructions="You are helpful.")
     >>> result = Runner.run_sync(
     ...     agent,
@@ -28,14 +28,20 @@ With pytest fixtures (auto-discovered):
 """
 
 from openai_agents_testkit.models import (
+    DelayMode,
     FakeModel,
     FakeModelProvider,
+    HistoryPolicy,
+    ResponseFactory,
     default_response_factory,
 )
 
 __all__ = [
+    "DelayMode",
     "FakeModel",
     "FakeModelProvider",
+    "HistoryPolicy",
+    "ResponseFactory",
     "default_response_factory",
 ]
 
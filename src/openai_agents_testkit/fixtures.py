@@ -17,32 +17,78 @@ Usage:
 
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING
 
 import pytest
+from agents.items import ModelResponse
 from agents.tracing import set_tracing_disabled
+from agents.usage import Usage
+from openai.types.responses import ResponseOutputMessage, ResponseOutputText
 
-from openai_agents_testkit.models import FakeModel, FakeModelProvider
+from openai_agents_testkit.models import (
+    DelayMode,
+    FakeModel,
+    FakeModelProvider,
+    HistoryPolicy,
+    ResponseFactory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
 
 
 def pytest_configure(config: pytest.Config) -> None:
-    """Disable OpenAI agents tracing when testkit is loaded.
+    """Warm up the response types built by FakeModel.
+
+    The one-time pydantic setup cost of these types is paid here, so it is
+    not charged to whichever test happens to call a FakeModel first.
+    """
+    del config  # unused but required by pytest hook signature
+    _warm_up_response_types()
+
+
+def _warm_up_response_types() -> None:
+    """Instantiate each response type once and discard the result."""
+    ResponseOutputText(type="output_text", text="", annotations=[])
+    ResponseOutputMessage(
+        id="msg-warmup",
+        type="message",
+        role="assistant",
+        content=[],
+        status="completed",
+    )
+    usage = Usage(requests=0, input_tokens=0, output_tokens=0, total_tokens=0)
+    ModelResponse(output=[], usage=usage, response_id="warmup")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _disable_tracing() -> None:
+    """Disable OpenAI agents tracing for the test session.
 
     Tracing is a separate telemetry subsystem that sends data to OpenAI's API.
     FakeModelProvider only mocks LLM API calls, not tracing calls.
-    This hook ensures tracing is disabled before any tests run,
-    preventing 401 errors from invalid API keys in test environments.
+    Disabling tracing for every test prevents 401 errors from invalid API
+    keys in test environments. Use the enable_tracing fixture in tests that
+    need tracing on.
     """
-    del config  # unused but required by pytest hook signature
     set_tracing_disabled(True)
 
 
-if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+@pytest.fixture
+def enable_tracing() -> Generator[None, None, None]:
+    """Enable OpenAI agents tracing for a single test.
 
-    from agents.items import TResponseInputItem
+    Tracing is disabled again after the test.
 
-    ResponseFactory = Callable[[int, str | list[TResponseInputItem]], str]
+    Example:
+        def test_traced_run(enable_tracing, fake_model_provider):
+            with trace("My workflow"):
+                ...
+    """
+    set_tracing_disabled(False)
+    yield
+    set_tracing_disabled(True)
 
 
 @pytest.fixture
@@ -52,26 +98,37 @@ def fake_model() -> Generator[FakeModel, None, None]:
     The model is reset after each test to ensure clean state.
 
     Yields:
-        A FakeModel instance with default settings (0.1s delay).
+        A FakeModel instance with default settings (no delay).
 
     Example:
         def test_model_calls(fake_model):
             # Use fake_model directly or via provider
             assert fake_model.call_count == 0
     """
-    model = FakeModel(delay=0.1)
+    model = FakeModel(delay=0)
     yield model
     model.reset()
 
 
+@pytest.fixture(scope="session")
+def _fake_model_provider_session() -> FakeModelProvider:
+    """Session-wide FakeModelProvider shared by fake_model_provider."""
+    return FakeModelProvider(delay=0)
+
+
 @pytest.fixture
-def fake_model_provider() -> Generator[FakeModelProvider, None, None]:
+def fake_model_provider(
+    _fake_model_provider_session: FakeModelProvider,
+) -> Generator[FakeModelProvider, None, None]:
     """Provide a FakeModelProvider instance for testing.
 
-    All models are cleared after each test to ensure clean state.
+    The provider is shared across the test session to avoid rebuilding it
+    for every test. After each test its cached models are cleared and any
+    attribute changes (delay, response_factory, ...) are undone, so every
+    test starts from a clean provider with default settings.
 
     Yields:
-        A FakeModelProvider instance with default settings.
+        A FakeModelProvider instance with default settings (no delay).
 
     Example:
         def test_agent(fake_model_provider):
@@ -82,16 +139,23 @@ def fake_model_provider() -> Generator[FakeModelProvider, None, None]:
                 run_config=RunConfig(model_provider=fake_model_provider),
             )
     """
-    provider = FakeModelProvider(delay=0.1)
+    provider = _fake_model_provider_session
+    settings = vars(provider).copy()
     yield provider
     provider.clear()
+    # Undo attribute changes made by the test, including new attributes
+    vars(provider).clear()
+    vars(provider).update(settings)
 
 
 @pytest.fixture
 def fake_model_provider_factory() -> Generator[Callable[..., FakeModelProvider], None, None]:
     """Factory fixture for creating customized FakeModelProvider instances.
 
-    Use this when you need to customize delay or response_factory.
+    Use this when you need to customize delay, delay_mode, response_factory,
+    history_policy, history_limit or record_calls.
+    Models respond immediately by default; pass a non-zero delay only in
+    tests that actually exercise latency (timeouts, cancellation, etc.).
 
     Yields:
         A factory function that creates FakeModelProvider instances.
@@ -101,18 +165,37 @@ def fake_model_provider_factory() -> Generator[Callable[..., FakeModelProvider],
             provider = fake_model_provider_factory(delay=2.0)
             # Test timeout handling...
 
+        def test_interleaving(fake_model_provider_factory):
+            # Yield to the event loop once per call without a real timer
+            provider = fake_model_provider_factory(delay_mode="yield")
+
         def test_custom_responses(fake_model_provider_factory):
             def custom_response(call_id, input):
                 return f"Custom: {input}"
             provider = fake_model_provider_factory(response_factory=custom_response)
+
+        def test_long_agent_loop(fake_model_provider_factory):
+            # Keep only the last 100 calls in call_history
+            provider = fake_model_provider_factory(history_limit=100)
     """
     providers: list[FakeModelProvider] = []
 
     def factory(
-        delay: float = 0.1,
+        delay: float = 0,
         response_factory: ResponseFactory | None = None,
+        delay_mode: DelayMode = "real",
+        history_policy: HistoryPolicy = "full",
+        history_limit: int | None = None,
+        record_calls: bool = True,
     ) -> FakeModelProvider:
-        provider = FakeModelProvider(delay=delay, response_factory=response_factory)
+        provider = FakeModelProvider(
+            delay=delay,
+            response_factory=response_factory,
+            delay_mode=delay_mode,
+            history_policy=history_policy,
+            history_limit=history_limit,
+            record_calls=record_calls,
+        )
         providers.append(provider)
         return provider
 
@@ -124,15 +207,20 @@ def fake_model_provider_factory() -> Generator[Callable[..., FakeModelProvider],
 
 
 @pytest.fixture
-def no_delay_provider() -> Generator[FakeModelProvider, None, None]:
-    """Provide a FakeModelProvider with zero delay for fast tests.
+def no_delay_provider(
+    fake_model_provider: FakeModelProvider,
+) -> Generator[FakeModelProvider, None, None]:
+    """Deprecated alias for fake_model_provider.
 
-    Useful when you don't need to test timing behavior and want
-    faster test execution.
+    fake_model_provider no longer simulates latency, so this fixture
+    is kept only for backwards compatibility.
 
     Yields:
-        A FakeModelProvider with delay=0.
+        The same provider as fake_model_provider.
     """
-    provider = FakeModelProvider(delay=0)
-    yield provider
-    provider.clear()
+    warnings.warn(
+        "no_delay_provider is deprecated; use fake_model_provider instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    yield fake_model_provider
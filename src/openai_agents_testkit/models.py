@@ -2,42 +2,207 @@
 
 from __future__ import annotations
 
-import asyncio
-import uuid
-from typing import TYPE_CHECKING, Any
+import copy
+import functools
+import itertools
+from asyncio import sleep
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Sequence,
+)
+from typing import Any, Literal, get_args
 
 from agents.items import ModelResponse, TResponseInputItem, TResponseStreamEvent
 from agents.models.interface import Model, ModelProvider, ModelTracing
 from agents.usage import Usage
 from openai.types.responses import ResponseOutputMessage, ResponseOutputText
 
-if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+# Public type aliases, defined at runtime so they can be imported and
+# introspected with typing.get_type_hints().
+ResponseFactory = Callable[[int, str | list[TResponseInputItem]], str]
+DelayMode = Literal["real", "yield", "none"]
+HistoryPolicy = Literal["full", "shallow", "none"]
 
-    ResponseFactory = Callable[[int, str | list[TResponseInputItem]], str]
+
+def _check_choice(name: str, value: str, choices: Any) -> None:
+    """Raise ValueError if value is not one of the Literal alias choices."""
+    allowed = get_args(choices)
+    if value not in allowed:
+        raise ValueError(f"{name} must be one of {allowed}, got {value!r}")
+
+
+def _check_history_limit(value: int | None) -> None:
+    """Raise ValueError unless history_limit is a positive integer or None."""
+    if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+        raise ValueError(f"history_limit must be a positive integer or None, got {value!r}")
+
+
+# Default response texts are memoized for the first call ids of every model,
+# which covers nearly all calls while keeping the cache bounded.
+_DEFAULT_RESPONSE_CACHE_SIZE = 1024
+_default_responses: dict[int, str] = {}
 
 
 def default_response_factory(call_id: int, input_: str | list[TResponseInputItem]) -> str:
     """Default response factory that returns a simple message."""
-    return f"Fake response #{call_id}"
+    text = _default_responses.get(call_id)
+    if text is None:
+        text = f"Fake response #{call_id}"
+        if call_id <= _DEFAULT_RESPONSE_CACHE_SIZE:
+            _default_responses[call_id] = text
+    return text
+
+
+# Message ids only need to be unique within the process, which a shared
+# counter guarantees more cheaply than uuid4.
+_message_ids = itertools.count(1)
+
+# Pydantic validates sequences into fresh lists, so passing a shared empty
+# tuple saves allocating a throwaway list on every call.
+_NO_ANNOTATIONS: tuple[Any, ...] = ()
+
+
+# Recorded fields per history policy, in column order.
+_HISTORY_FIELDS = {
+    "full": ("call_id", "system_instructions", "input", "tools", "output_schema"),
+    "shallow": ("call_id", "system_instructions", "input_len", "input_hash", "tools_count"),
+    "none": (),
+}
+
+
+class _CallRecord(Mapping[str, Any]):
+    """Lightweight, read-only record of a single FakeModel call.
+
+    A Mapping, so it behaves like the dict records previously stored in
+    call_history (record["input"], .get(), .keys(), "input" in record,
+    equality with a dict), and also supports attribute access (record.input).
+    """
+
+    __slots__ = ("_fields", "_values")
+
+    def __init__(self, fields: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        self._fields = fields
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._fields.index(key)]
+        except ValueError:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self._fields, self._values, strict=True)
+        )
+        return f"_CallRecord({fields})"
+
+
+class _CallHistoryView(Sequence[_CallRecord]):
+    """List-like view over the per-field call columns of a FakeModel.
+
+    Records are materialized on access, so recording a call only costs one
+    list append per field. Compares equal to a list of equal records or dicts.
+    """
+
+    __slots__ = ("_columns", "_fields")
+
+    def __init__(self, fields: tuple[str, ...], columns: tuple[MutableSequence[Any], ...]) -> None:
+        self._fields = fields
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            # Columns may be deques, which do not support slicing
+            rows = zip(
+                *(
+                    (list(column) if isinstance(column, deque) else column)[index]
+                    for column in self._columns
+                ),
+                strict=True,
+            )
+            return [_CallRecord(self._fields, row) for row in rows]
+        if not self._columns:
+            raise IndexError("call history is not recorded")
+        return _CallRecord(self._fields, tuple(column[index] for column in self._columns))
+
+    def __iter__(self) -> Iterator[_CallRecord]:
+        for row in zip(*self._columns, strict=True):
+            yield _CallRecord(self._fields, row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_CallHistoryView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> list[dict[str, Any]]:
+        """Return the records as a plain list of dicts, e.g. for json.dumps."""
+        return [
+            dict(zip(self._fields, row, strict=True)) for row in zip(*self._columns, strict=True)
+        ]
+
+    def _clear(self) -> None:
+        """Remove all records."""
+        for column in self._columns:
+            column.clear()
 
 
 class FakeModel(Model):
     """Fake model that returns predefined responses without calling any API.
 
-    This model simulates API latency and returns configurable responses,
-    making it ideal for testing agent behavior without actual API calls.
+    This model returns configurable responses and can optionally simulate
+    API latency, making it ideal for testing agent behavior without actual API calls.
 
     Args:
-        delay: Simulated response delay in seconds. Defaults to 0.1.
+        delay: Simulated response delay in seconds. Defaults to 0.0 (no delay).
         response_factory: Optional callable that generates response text.
             Receives (call_id, input) and returns the response string.
+        delay_mode: How the delay is simulated. "real" sleeps for delay
+            seconds, "yield" yields to the event loop once without arming a
+            timer (useful for ordering-only tests), and "none" never awaits.
+            Defaults to "real".
+        history_policy: What call_history records. "full" keeps every
+            argument, "shallow" keeps only call_id, system_instructions,
+            input_len, input_hash and tools_count (so large inputs are not
+            kept alive), and "none" records nothing, for tests that only
+            check call_count. Defaults to "full".
+        history_limit: Maximum number of calls kept in call_history, as a
+            positive integer. When set, only the most recent calls are kept,
+            so memory stays bounded in long-running tests. Defaults to None
+            (unbounded).
+        record_calls: Shorthand for history_policy="none" when False.
+            Defaults to True.
 
     Example:
         >>> from openai_agents_testkit import FakeModel, FakeModelProvider
         >>> from agents import Agent, Runner, RunConfig
         >>>
-        >>> provider = FakeModelProvider(delay=0.1)
+        >>> provider = FakeModelProvider()
         >>> agent = Agent(name="Test", model="fake-model", instructions="Test")
         >>> result = Runner.run_sync(
         ...     agent,
@@ -46,15 +211,192 @@ class FakeModel(Model):
         ... )
     """
 
+    # Shared default; only instances with a custom factory get their own attribute.
+    response_factory: ResponseFactory = staticmethod(default_response_factory)
+
     def __init__(
         self,
-        delay: float = 0.1,
+        delay: float = 0.0,
         response_factory: ResponseFactory | None = None,
+        delay_mode: DelayMode = "real",
+        history_policy: HistoryPolicy = "full",
+        history_limit: int | None = None,
+        record_calls: bool = True,
     ) -> None:
-        self.delay = delay
-        self.response_factory = response_factory or default_response_factory
+        _check_choice("history_policy", history_policy, HistoryPolicy)
+        _check_history_limit(history_limit)
+        if not record_calls:
+            history_policy = "none"
+        self._delay = delay
+        self.delay_mode = delay_mode
+        if response_factory is not None:
+            self.response_factory = response_factory
+        self._history_policy = history_policy
         self.call_count = 0
-        self.call_history: list[dict[str, Any]] = []
+        self._history_limit = history_limit
+        # Call history is stored column-wise (one sequence per recorded field)
+        # and exposed through the call_history view. With a history_limit the
+        # columns are ring buffers that drop the oldest calls.
+        new_column: Callable[[], MutableSequence[Any]] = (
+            list if history_limit is None else functools.partial(deque, maxlen=history_limit)
+        )
+        self._call_ids: MutableSequence[int] = new_column()
+        self._system_instructions: MutableSequence[str | None] = new_column()
+        self._inputs: MutableSequence[str | list[TResponseInputItem]] = new_column()
+        self._tools: MutableSequence[list[Any]] = new_column()
+        self._output_schemas: MutableSequence[Any] = new_column()
+        self._input_lens: MutableSequence[int | None] = new_column()
+        self._input_hashes: MutableSequence[int | None] = new_column()
+        self._tools_counts: MutableSequence[int] = new_column()
+        columns = {
+            "full": (
+                self._call_ids,
+                self._system_instructions,
+                self._inputs,
+                self._tools,
+                self._output_schemas,
+            ),
+            "shallow": (
+                self._call_ids,
+                self._system_instructions,
+                self._input_lens,
+                self._input_hashes,
+                self._tools_counts,
+            ),
+            "none": (),
+        }
+        self._call_history = _CallHistoryView(
+            _HISTORY_FIELDS[history_policy], columns[history_policy]
+        )
+        self._record = self._make_recorder()
+
+    @property
+    def delay(self) -> float:
+        """Simulated response delay in seconds."""
+        return self._delay
+
+    @delay.setter
+    def delay(self, value: float) -> None:
+        self._delay = value
+        self._update_pause()
+
+    @property
+    def delay_mode(self) -> DelayMode:
+        """How the delay is simulated ("real", "yield" or "none")."""
+        return self._delay_mode
+
+    @delay_mode.setter
+    def delay_mode(self, value: DelayMode) -> None:
+        _check_choice("delay_mode", value, DelayMode)
+        self._delay_mode = value
+        self._update_pause()
+
+    @property
+    def history_policy(self) -> HistoryPolicy:
+        """What call_history records. Fixed at construction."""
+        return self._history_policy
+
+    @property
+    def history_limit(self) -> int | None:
+        """Maximum number of calls kept in call_history. Fixed at construction."""
+        return self._history_limit
+
+    @property
+    def record_calls(self) -> bool:
+        """Whether calls are recorded in call_history at all."""
+        return self._history_policy != "none"
+
+    def _update_pause(self) -> None:
+        """Precompute how long get_response sleeps, or None to not await at all."""
+        if self._delay_mode == "yield":
+            self._pause: float | None = 0
+        elif self._delay_mode == "real" and self._delay > 0:
+            self._pause = self._delay
+        else:
+            self._pause = None
+
+    def _make_recorder(self) -> Callable[..., None] | None:
+        """Build the call recorder for history_policy, or None to not record."""
+        if self._history_policy == "full":
+            append_call_id = self._call_ids.append
+            append_system_instructions = self._system_instructions.append
+            append_input = self._inputs.append
+            append_tools = self._tools.append
+            append_output_schema = self._output_schemas.append
+
+            def record_full(
+                call_id: int,
+                system_instructions: str | None,
+                input: str | list[TResponseInputItem],
+                tools: list[Any],
+                output_schema: Any,
+            ) -> None:
+                append_call_id(call_id)
+                append_system_instructions(system_instructions)
+                append_input(input)
+                append_tools(tools)
+                append_output_schema(output_schema)
+
+            return record_full
+
+        if self._history_policy == "shallow":
+            append_call_id = self._call_ids.append
+            append_system_instructions = self._system_instructions.append
+            append_input_len = self._input_lens.append
+            append_input_hash = self._input_hashes.append
+            append_tools_count = self._tools_counts.append
+
+            def record_shallow(
+                call_id: int,
+                system_instructions: str | None,
+                input: str | list[TResponseInputItem],
+                tools: list[Any],
+                output_schema: Any,
+            ) -> None:
+                append_call_id(call_id)
+                append_system_instructions(system_instructions)
+                append_input_len(len(input) if isinstance(input, list) else None)
+                append_input_hash(hash(input) if isinstance(input, str) else None)
+                append_tools_count(len(tools))
+
+            return record_shallow
+
+        return None
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> FakeModel:
+        """Deep-copy the model with a recorder bound to the copied history."""
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        state = vars(clone)
+        for name, value in vars(self).items():
+            if name != "_record":
+                state[name] = copy.deepcopy(value, memo)
+        # The recorder closes over this model's columns; rebuild it for the copy
+        clone._record = clone._make_recorder()
+        return clone
+
+    @property
+    def call_history(self) -> _CallHistoryView:
+        """Recorded calls, oldest first.
+
+        Each record supports both record["input"] and record.input access.
+        """
+        return self._call_history
+
+    @property
+    def call_ids(self) -> list[int]:
+        """Call ids of all recorded calls."""
+        return list(self._call_ids)
+
+    @property
+    def inputs_array(self) -> list[str | list[TResponseInputItem]]:
+        """Inputs of all recorded calls, for bulk assertions."""
+        return list(self._inputs)
+
+    @property
+    def system_instructions_array(self) -> list[str | None]:
+        """System instructions of all recorded calls, for bulk assertions."""
+        return list(self._system_instructions)
 
     async def get_response(
         self,
@@ -72,26 +414,61 @@ class FakeModel(Model):
     ) -> ModelResponse:
         """Return a fake response after simulated delay.
 
-        Records call details in call_history for test assertions.
+        Records call details in call_history for test assertions,
+        according to history_policy.
         """
+        call_id = self._record_call(system_instructions, input, tools, output_schema)
+
+        # Simulate async work / API latency (picked once from the delay settings)
+        pause = self._pause
+        if pause is not None:
+            await sleep(pause)
+
+        return self._build_response(call_id, input)
+
+    def get_response_sync(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: Any,
+        tools: list[Any],
+        output_schema: Any,
+        handoffs: list[Any],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None = None,
+        conversation_id: str | None = None,
+        prompt: Any = None,
+    ) -> ModelResponse:
+        """Return a fake response immediately, without an event loop.
+
+        Same as get_response, but synchronous and never delayed. Useful for
+        tests that exercise the model directly and don't need asyncio.
+        """
+        call_id = self._record_call(system_instructions, input, tools, output_schema)
+        return self._build_response(call_id, input)
+
+    def _record_call(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        tools: list[Any],
+        output_schema: Any,
+    ) -> int:
+        """Count and record the call, returning its call id."""
         self.call_count += 1
         call_id = self.call_count
 
-        # Record call for test assertions
-        self.call_history.append(
-            {
-                "call_id": call_id,
-                "system_instructions": system_instructions,
-                "input": input,
-                "tools": tools,
-                "output_schema": output_schema,
-            }
-        )
+        # Record call for test assertions (the recorder is picked once
+        # from history_policy, not on every call)
+        record = self._record
+        if record is not None:
+            record(call_id, system_instructions, input, tools, output_schema)
 
-        # Simulate async work / API latency
-        if self.delay > 0:
-            await asyncio.sleep(self.delay)
+        return call_id
 
+    def _build_response(self, call_id: int, input: str | list[TResponseInputItem]) -> ModelResponse:
+        """Build the response for a recorded call."""
         # Generate response text
         response_text = self.response_factory(call_id, input)
 
@@ -99,18 +476,20 @@ class FakeModel(Model):
         text_content = ResponseOutputText(
             type="output_text",
             text=response_text,
-            annotations=[],
+            annotations=_NO_ANNOTATIONS,
         )
         message = ResponseOutputMessage(
-            id=f"msg-{uuid.uuid4().hex[:8]}",
+            id=f"msg-{next(_message_ids):08x}",
             type="message",
             role="assistant",
-            content=[text_content],
+            content=(text_content,),
             status="completed",
         )
 
         return ModelResponse(
             output=[message],
+            # Each response gets its own Usage: the runner rewrites it in place
+            # after a retried call, so a shared instance would leak across runs.
             usage=Usage(requests=1, input_tokens=100, output_tokens=50, total_tokens=150),
             response_id=f"fake-response-{call_id}",
         )
@@ -141,7 +520,7 @@ class FakeModel(Model):
     def reset(self) -> None:
         """Reset call count and history for clean test state."""
         self.call_count = 0
-        self.call_history.clear()
+        self._call_history._clear()
 
 
 class FakeModelProvider(ModelProvider):
@@ -151,8 +530,14 @@ class FakeModelProvider(ModelProvider):
     allowing consistent model access across multiple agent runs.
 
     Args:
-        delay: Response delay for all models. Defaults to 0.1.
+        delay: Response delay for all models. Defaults to 0.0 (no delay).
         response_factory: Optional response factory for all models.
+        delay_mode: Delay mode for all models. Defaults to "real".
+        history_policy: What models record in call_history. Defaults to "full".
+        history_limit: Maximum number of calls each model keeps in
+            call_history, as a positive integer. Defaults to None (unbounded).
+        record_calls: Shorthand for history_policy="none" when False.
+            Defaults to True.
 
     Example:
         >>> provider = FakeModelProvider(delay=0.5)
@@ -163,13 +548,28 @@ class FakeModelProvider(ModelProvider):
 
     def __init__(
         self,
-        delay: float = 0.1,
+        delay: float = 0.0,
         response_factory: ResponseFactory | None = None,
+        delay_mode: DelayMode = "real",
+        history_policy: HistoryPolicy = "full",
+        history_limit: int | None = None,
+        record_calls: bool = True,
     ) -> None:
+        _check_choice("delay_mode", delay_mode, DelayMode)
+        _check_choice("history_policy", history_policy, HistoryPolicy)
+        _check_history_limit(history_limit)
         self.delay = delay
         self.response_factory = response_factory
+        self.delay_mode = delay_mode
+        self.history_policy: HistoryPolicy = history_policy if record_calls else "none"
+        self.history_limit = history_limit
         self._models: dict[str | None, FakeModel] = {}
 
+    @property
+    def record_calls(self) -> bool:
+        """Whether created models record calls in call_history at all."""
+        return self.history_policy != "none"
+
     def get_model(self, model_name: str | None) -> Model:
         """Get or create a FakeModel for the given model name.
 
@@ -179,12 +579,43 @@ class FakeModelProvider(ModelProvider):
         Returns:
             A FakeModel instance, cached per model_name.
         """
-        if model_name not in self._models:
-            self._models[model_name] = FakeModel(
-                delay=self.delay,
-                response_factory=self.response_factory,
-            )
-        return self._models[model_name]
+        # A plain dict lookup is the fastest hit path here; wrapping model
+        # creation in functools.cache measured slower on cache hits.
+        model = self._models.get(model_name)
+        if model is not None:
+            return model
+        return self._create_model(model_name)
+
+    def _create_model(self, model_name: str | None) -> FakeModel:
+        """Create and cache the FakeModel for a model name on a cache miss."""
+        model = FakeModel(
+            delay=self.delay,
+            response_factory=self.response_factory,
+            delay_mode=self.delay_mode,
+            history_policy=self.history_policy,
+            history_limit=self.history_limit,
+        )
+        # setdefault is atomic, so concurrent callers racing on a miss all
+        # get the same cached instance and no recorded calls are lost.
+        return self._models.setdefault(model_name, model)
+
+    def get_model_batch(self, model_names: Iterable[str | None]) -> dict[str | None, FakeModel]:
+        """Get or create FakeModels for several model names in one pass.
+
+        Args:
+            model_names: The model identifiers. Any iterable is consumed once.
+
+        Returns:
+            A dict mapping each model name to its cached FakeModel.
+        """
+        models = self._models
+        batch: dict[str | None, FakeModel] = {}
+        for model_name in model_names:
+            model = models.get(model_name)
+            if model is None:
+                model = self._create_model(model_name)
+            batch[model_name] = model
+        return batch
 
     def get_all_models(self) -> dict[str | None, FakeModel]:
         """Get all created model instances.
@@ -3,13 +3,21 @@
 # Re-export fixtures from the package for local development
 # (When installed, fixtures are auto-discovered via pytest11 entry point)
 from openai_agents_testkit.fixtures import (
+    _disable_tracing,
+    _fake_model_provider_session,
+    enable_tracing,
     fake_model,
     fake_model_provider,
     fake_model_provider_factory,
     no_delay_provider,
 )
 
+pytest_plugins = ["pytester"]
+
 __all__ = [
+    "_disable_tracing",
+    "_fake_model_provider_session",
+    "enable_tracing",
     "fake_model",
     "fake_model_provider",
     "fake_model_provider_factory",
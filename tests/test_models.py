@@ -1,9 +1,16 @@
 """Tests for FakeModel and FakeModelProvider."""
 
+import asyncio
+import copy
+import json
+import typing
+
 import pytest
-from agents import Agent, RunConfig, Runner
+from agents import Agent, ModelRetrySettings, ModelSettings, RunConfig, Runner
+from agents.tracing import trace
+from agents.tracing.traces import NoOpTrace
 
-from openai_agents_testkit import FakeModel, FakeModelProvider
+from openai_agents_testkit import FakeModel, FakeModelProvider, default_response_factory
 
 
 class TestFakeModel:
@@ -76,6 +83,250 @@ class TestFakeModel:
         assert model.call_history[0]["system_instructions"] == "Be helpful"
         assert model.call_history[0]["input"] == "Test input"
 
+    @pytest.mark.asyncio
+    async def test_message_ids_are_unique_across_models(self):
+        """Test that message ids are sequential and unique across models."""
+        responses = [
+            await FakeModel(delay=0).get_response(
+                system_instructions=None,
+                input="Hello",
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+            for _ in range(2)
+        ]
+
+        first, second = (int(r.output[0].id.removeprefix("msg-"), 16) for r in responses)
+        assert second == first + 1
+
+    @pytest.mark.asyncio
+    async def test_call_history_records_attributes(self):
+        """Test that call_history records expose fields as attributes."""
+        model = FakeModel(delay=0)
+
+        await model.get_response(
+            system_instructions="Be helpful",
+            input="Test input",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        record = model.call_history[0]
+        assert record.call_id == 1
+        assert record.input == "Test input"
+        with pytest.raises(KeyError):
+            record["unknown"]
+
+    @pytest.mark.asyncio
+    async def test_call_history_behaves_like_list_of_dicts(self):
+        """Test that call_history stays compatible with a list of dicts."""
+        model = FakeModel(delay=0)
+        assert model.call_history == []
+
+        await model.get_response(
+            system_instructions="Be helpful",
+            input="Test input",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        record = model.call_history[0]
+        expected = {
+            "call_id": 1,
+            "system_instructions": "Be helpful",
+            "input": "Test input",
+            "tools": [],
+            "output_schema": None,
+        }
+        assert "input" in record
+        assert "unknown" not in record
+        assert record.get("input") == "Test input"
+        assert record.get("unknown") is None
+        assert list(record.keys()) == list(expected)
+        assert dict(record) == expected
+        assert record == expected
+        assert model.call_history == [expected]
+        assert [expected] == model.call_history
+        assert model.call_history != [{**expected, "input": "Other"}]
+
+        history = model.call_history.copy()
+        assert history == [expected]
+        assert type(history) is list
+        assert type(history[0]) is dict
+        assert json.loads(json.dumps(history)) == [expected]
+        assert not hasattr(model.call_history, "append")
+        assert not hasattr(model.call_history, "clear")
+
+    @pytest.mark.asyncio
+    async def test_bulk_call_history_accessors(self):
+        """Test that per-field accessors return values for all recorded calls."""
+        model = FakeModel(delay=0)
+
+        for text in ("First", "Second"):
+            await model.get_response(
+                system_instructions=f"System {text}",
+                input=text,
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+
+        assert model.call_ids == [1, 2]
+        assert model.inputs_array == ["First", "Second"]
+        assert model.system_instructions_array == ["System First", "System Second"]
+        assert [record["input"] for record in model.call_history] == ["First", "Second"]
+        assert [record.call_id for record in model.call_history[1:]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_history_limit_keeps_most_recent_calls(self):
+        """Test that history_limit bounds call_history to the latest calls."""
+        model = FakeModel(delay=0, history_limit=2)
+
+        for text in ("First", "Second", "Third"):
+            await model.get_response(
+                system_instructions=None,
+                input=text,
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+
+        assert model.call_count == 3
+        assert len(model.call_history) == 2
+        assert model.call_history[0]["input"] == "Second"
+        assert [record.call_id for record in model.call_history[-1:]] == [3]
+        assert model.inputs_array == ["Second", "Third"]
+
+        model.reset()
+        assert len(model.call_history) == 0
+
+    @pytest.mark.parametrize("history_limit", [0, -1, 1.5, True])
+    def test_invalid_history_limit_raises(self, history_limit):
+        """Test that history_limit must be a positive integer or None."""
+        with pytest.raises(ValueError, match="history_limit must be a positive integer"):
+            FakeModel(history_limit=history_limit)
+        with pytest.raises(ValueError, match="history_limit must be a positive integer"):
+            FakeModelProvider(history_limit=history_limit)
+
+    def test_history_limit_is_read_only(self):
+        """Test that history_limit cannot be changed after construction."""
+        model = FakeModel(history_limit=2)
+
+        assert model.history_limit == 2
+        with pytest.raises(AttributeError):
+            model.history_limit = 10
+
+    @pytest.mark.asyncio
+    async def test_history_policy_none(self):
+        """Test that history_policy="none" skips call_history but counts calls."""
+        model = FakeModel(delay=0, history_policy="none")
+
+        await model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert model.call_count == 1
+        assert len(model.call_history) == 0
+
+    @pytest.mark.asyncio
+    async def test_record_calls_false_is_history_policy_none(self):
+        """Test that record_calls=False is an alias for history_policy="none"."""
+        model = FakeModel(delay=0, record_calls=False)
+
+        await model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert model.history_policy == "none"
+        assert model.record_calls is False
+        assert model.call_count == 1
+        assert len(model.call_history) == 0
+
+        provider = FakeModelProvider(record_calls=False)
+        assert provider.get_model("test").history_policy == "none"
+
+    def test_invalid_history_policy_raises(self):
+        """Test that an unknown history_policy raises ValueError."""
+        with pytest.raises(ValueError, match="history_policy must be one of"):
+            FakeModel(history_policy="bogus")
+        with pytest.raises(ValueError, match="history_policy must be one of"):
+            FakeModelProvider(history_policy="bogus")
+
+    @pytest.mark.asyncio
+    async def test_history_policy_shallow(self):
+        """Test that history_policy="shallow" records digests instead of inputs."""
+        model = FakeModel(delay=0, history_policy="shallow")
+        items = [{"role": "user", "content": "Hello"}]
+
+        for input_ in ("Hello", items):
+            await model.get_response(
+                system_instructions="Be helpful",
+                input=input_,
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+
+        first, second = model.call_history
+        assert first["system_instructions"] == "Be helpful"
+        assert first["input_hash"] == hash("Hello")
+        assert first["input_len"] is None
+        assert second["input_len"] == 1
+        assert second.tools_count == 0
+        assert model.inputs_array == []
+        with pytest.raises(KeyError):
+            second["input"]
+
+    @pytest.mark.asyncio
+    async def test_responses_do_not_share_mutable_fields(self):
+        """Test that each response gets its own content and annotations lists."""
+        model = FakeModel(delay=0)
+
+        first, second = [
+            await model.get_response(
+                system_instructions=None,
+                input="Hello",
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+            for _ in range(2)
+        ]
+
+        first.output[0].content[0].annotations.append("mutated")
+
+        assert isinstance(first.output[0].content, list)
+        assert second.output[0].content[0].annotations == []
+
     @pytest.mark.asyncio
     async def test_custom_response_factory(self):
         """Test that custom response_factory is used."""
@@ -99,17 +350,212 @@ class TestFakeModel:
         text = response.output[0].content[0].text
         assert text == "Custom: Hello"
 
+    @pytest.mark.asyncio
+    async def test_falsy_response_factory_is_used(self):
+        """Test that a factory object that is falsy is still used."""
+
+        class FalsyFactory:
+            def __bool__(self):
+                return False
+
+            def __call__(self, call_id, input):
+                return "From falsy factory"
+
+        model = FakeModel(delay=0, response_factory=FalsyFactory())
+
+        response = await model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert response.output[0].content[0].text == "From falsy factory"
+
+    def test_default_response_factory_is_shared(self):
+        """Test that models without a custom factory use the class default."""
+        model = FakeModel()
+
+        assert model.response_factory is default_response_factory
+        assert "response_factory" not in vars(model)
+
+    @pytest.mark.asyncio
+    async def test_response_factory_runs_after_delay(self):
+        """Test that get_response calls response_factory after the delay."""
+        events = []
+
+        def factory(call_id, input_):
+            events.append("factory")
+            return "ok"
+
+        async def during_delay():
+            events.append("delay")
+
+        model = FakeModel(delay_mode="yield", response_factory=factory)
+        task = asyncio.ensure_future(during_delay())
+
+        await model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+        await task
+
+        assert events == ["delay", "factory"]
+
+    def test_get_response_sync(self):
+        """Test that get_response_sync responds without an event loop."""
+        model = FakeModel(delay=10)
+
+        response = model.get_response_sync(
+            system_instructions="Be helpful",
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert response.output[0].content[0].text == "Fake response #1"
+        assert model.call_count == 1
+        assert model.call_history[0]["system_instructions"] == "Be helpful"
+
+    @pytest.mark.parametrize("history_policy", ["full", "shallow"])
+    def test_deepcopy_keeps_separate_history(self, history_policy):
+        """Test that a deep-copied model records calls into its own history."""
+        model = FakeModel(history_policy=history_policy)
+        clone = copy.deepcopy(model)
+
+        clone.get_response_sync(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert len(clone.call_history) == 1
+        assert clone.call_history[0]["call_id"] == 1
+        assert len(model.call_history) == 0
+        assert model.call_count == 0
+
+    def test_signatures_resolve_at_runtime(self):
+        """Test that typing.get_type_hints resolves the public signatures."""
+        for function in (
+            FakeModel.__init__,
+            FakeModel.stream_response,
+            FakeModelProvider.__init__,
+            FakeModelProvider.get_model_batch,
+        ):
+            assert "return" in typing.get_type_hints(function)
+
     def test_reset_clears_state(self):
         """Test that reset() clears call_count and call_history."""
         model = FakeModel(delay=0)
-        model.call_count = 5
-        model.call_history.append({"test": "data"})
+        model.get_response_sync(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
 
         model.reset()
 
         assert model.call_count == 0
         assert len(model.call_history) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("delay", "delay_mode", "expected_sleeps"),
+        [
+            (0, "real", []),
+            (0.5, "real", [0.5]),
+            (0.5, "yield", [0]),
+            (0.5, "none", []),
+        ],
+    )
+    async def test_delay_mode(self, monkeypatch, delay, delay_mode, expected_sleeps):
+        """Test that delay_mode controls how the delay is simulated."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("openai_agents_testkit.models.sleep", fake_sleep)
+        model = FakeModel(delay=delay, delay_mode=delay_mode)
+
+        await model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert sleeps == expected_sleeps
+
+    def test_default_response_factory(self):
+        """Test that the default factory numbers responses by call id."""
+        assert default_response_factory(1, "Hello") == "Fake response #1"
+        assert default_response_factory(1, "Other") == "Fake response #1"
+        assert default_response_factory(10_000, "Hello") == "Fake response #10000"
+
+    def test_invalid_delay_mode_raises(self):
+        """Test that an unknown delay_mode is rejected instead of disabling delay."""
+        with pytest.raises(ValueError, match="delay_mode must be one of"):
+            FakeModel(delay=0.5, delay_mode="sleep")
+
+        model = FakeModel(delay=0.5)
+        with pytest.raises(ValueError, match="delay_mode must be one of"):
+            model.delay_mode = "sleep"
+        assert model.delay_mode == "real"
+
+    @pytest.mark.asyncio
+    async def test_changing_delay_after_construction(self, monkeypatch):
+        """Test that delay and delay_mode can still be changed on a model."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("openai_agents_testkit.models.sleep", fake_sleep)
+        model = FakeModel(delay=0)
+        model.delay = 0.5
+
+        for _ in range(2):
+            await model.get_response(
+                system_instructions=None,
+                input="Hello",
+                model_settings=None,
+                tools=[],
+                output_schema=None,
+                handoffs=[],
+                tracing=None,
+            )
+            model.delay_mode = "none"
+
+        assert sleeps == [0.5]
+
+    def test_default_delay_is_zero(self):
+        """Test that models do not simulate latency unless asked to."""
+        assert FakeModel().delay == 0
+        assert FakeModelProvider().get_model("test").delay == 0
+
     def test_stream_response_raises_not_implemented(self):
         """Test that stream_response raises NotImplementedError."""
         model = FakeModel()
@@ -148,6 +594,17 @@ class TestFakeModelProvider:
         assert model1 is model2
         assert model1 is not model3
 
+    def test_get_model_batch(self):
+        """Test that get_model_batch returns cached models for every name."""
+        provider = FakeModelProvider()
+        existing = provider.get_model("model-a")
+
+        batch = provider.get_model_batch(name for name in ["model-a", "model-b"])
+
+        assert batch["model-a"] is existing
+        assert batch["model-b"] is provider.get_model("model-b")
+        assert list(batch) == ["model-a", "model-b"]
+
     def test_get_all_models(self):
         """Test that get_all_models returns all created models."""
         provider = FakeModelProvider()
@@ -171,6 +628,16 @@ class TestFakeModelProvider:
         provider.clear()
         assert len(provider.get_all_models()) == 0
 
+    def test_get_model_after_clear_creates_new_model(self):
+        """Test that clear() also invalidates the get_model cache."""
+        provider = FakeModelProvider()
+        model = provider.get_model("test")
+
+        provider.clear()
+
+        assert provider.get_model("test") is not model
+        assert provider.get_all_models() == {"test": provider.get_model("test")}
+
     def test_provider_passes_delay_to_models(self):
         """Test that provider delay is passed to created models."""
         provider = FakeModelProvider(delay=0.5)
@@ -179,6 +646,22 @@ class TestFakeModelProvider:
 
         assert model.delay == 0.5
 
+    def test_provider_passes_history_limit_to_models(self):
+        """Test that provider history_limit is passed to created models."""
+        provider = FakeModelProvider(history_limit=10)
+
+        model = provider.get_model("test")
+
+        assert model.history_limit == 10
+
+    def test_provider_passes_delay_mode_to_models(self):
+        """Test that provider delay_mode is passed to created models."""
+        provider = FakeModelProvider(delay_mode="yield")
+
+        model = provider.get_model("test")
+
+        assert model.delay_mode == "yield"
+
 
 class TestIntegration:
     """Integration tests with actual Agent and Runner."""
@@ -201,6 +684,37 @@ class TestIntegration:
         assert result.final_output is not None
         assert "Fake response" in result.final_output
 
+    def test_retried_usage_does_not_leak_into_later_runs(self):
+        """Test that usage rewritten by a retried call stays with that response."""
+        failed = []
+
+        def flaky_factory(call_id, input_):
+            if not failed:
+                failed.append(call_id)
+                raise RuntimeError("transient failure")
+            return "ok"
+
+        agent = Agent(
+            name="Test Agent",
+            model="gpt-4",
+            instructions="Test",
+            model_settings=ModelSettings(
+                retry=ModelRetrySettings(max_retries=2, policy=lambda context: True)
+            ),
+        )
+        provider = FakeModelProvider(response_factory=flaky_factory)
+        result = Runner.run_sync(
+            agent, "Hello", run_config=RunConfig(model_provider=provider), max_turns=1
+        )
+        assert result.context_wrapper.usage.requests == 2
+
+        agent = Agent(name="Test Agent", model="gpt-4", instructions="Test")
+        result = Runner.run_sync(
+            agent, "Hello", run_config=RunConfig(model_provider=FakeModelProvider()), max_turns=1
+        )
+        assert result.context_wrapper.usage.requests == 1
+        assert len(result.context_wrapper.usage.request_usage_entries) == 1
+
     def test_multiple_agents_share_provider(self, fake_model_provider):
         """Test that multiple agents can share the same provider."""
         agent1 = Agent(name="Agent 1", model="gpt-4", instructions="First")
@@ -214,3 +728,58 @@ class TestIntegration:
         # Both should use the same model instance
         model = fake_model_provider.get_model("gpt-4")
         assert model.call_count == 2
+
+    def test_fixture_provider_has_no_delay(self, fake_model_provider):
+        """Test that the fake_model_provider fixture does not simulate latency."""
+        assert fake_model_provider.get_model("gpt-4").delay == 0
+
+    def test_no_delay_provider_is_deprecated_alias(self, request):
+        """Test that no_delay_provider warns and aliases fake_model_provider."""
+        with pytest.warns(DeprecationWarning, match="no_delay_provider"):
+            provider = request.getfixturevalue("no_delay_provider")
+
+        assert provider is request.getfixturevalue("fake_model_provider")
+
+    @pytest.mark.asyncio
+    async def test_fake_model_fixture_in_async_test(self, fake_model):
+        """Test that the synchronous fixtures can be used from async tests."""
+        await fake_model.get_response(
+            system_instructions=None,
+            input="Hello",
+            model_settings=None,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=None,
+        )
+
+        assert fake_model.call_count == 1
+
+    def test_tracing_disabled_by_default(self):
+        """Test that tracing is disabled for tests."""
+        assert isinstance(trace("Test workflow"), NoOpTrace)
+
+    def test_enable_tracing_fixture(self, enable_tracing):
+        """Test that enable_tracing turns tracing on for the test."""
+        assert not isinstance(trace("Test workflow"), NoOpTrace)
+
+    def test_fake_model_provider_is_clean_in_next_test(self, pytester):
+        """Test that changes to the shared provider do not leak between tests."""
+        pytester.makepyfile(
+            """
+            def test_a(fake_model_provider):
+                fake_model_provider.response_factory = lambda call_id, input: "custom"
+                fake_model_provider.delay = 0.3
+                fake_model_provider.get_model("gpt-4").delay = 0.3
+
+            def test_b(fake_model_provider):
+                assert fake_model_provider.get_all_models() == {}
+                assert fake_model_provider.response_factory is None
+                assert fake_model_provider.delay == 0
+                assert fake_model_provider.get_model("gpt-4").delay == 0
+            """
+        )
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "-p", "no:asyncio")
+
+        result.assert_outcomes(passed=2)